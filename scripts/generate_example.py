@@ -3,89 +3,84 @@
 Generate an example progress plot and bullet points for documentation.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import numpy as np
 from datetime import datetime, timedelta
-import json
 
+from track_progress import (DEFAULT_CATEGORIES, DEFAULT_CONFIG, create_progress_plot,
+                            format_commit_dates, parse_commit_categories)
 
-def generate_example_data():
-    """Generate example progress data."""
+
+EXAMPLE_MESSAGES = [
+    "Notes: Added introduction and background",
+    "Milestone: Completed literature review", 
+    "Progress: Wrote methodology section",
+    "Notes: Added experimental setup figures",
+    "Revisions: Addressed reviewer comments on theory",
+    "Fix: Corrected equations in section 3",
+    "Reference: Added recent citations",
+    "Progress: Finished results analysis",
+    "Milestone: Completed first draft",
+    "Notes: Added discussion section",
+    "Revisions: Updated abstract and conclusions",
+    "Fix: Corrected table formatting",
+    "Progress: Added appendix materials",
+    "Notes: Improved figure captions",
+    "Milestone: Submitted for review"
+]
+
+
+def generate_word_counts(rng, base_count=1000, n_points=20):
+    """Generate a realistic word count progression in one batch of draws."""
+    # Early commits grow linearly from the base count
+    word_counts = np.empty(n_points, dtype=np.int64)
+    word_counts[:5] = base_count + np.arange(5) * 200 + rng.integers(-50, 100, size=5, dtype=np.int32)
+    
+    # Later commits add a random number of words each
+    low = np.repeat([100, 150, 50], [5, 5, n_points - 15])
+    high = np.repeat([300, 400, 200], [5, 5, n_points - 15])
+    deltas = rng.integers(low, high, dtype=np.int32)
+    word_counts[5:] = word_counts[4] + np.cumsum(deltas)
+    
+    return word_counts.tolist()
+
+
+def generate_example_data(seed=42):
+    """Generate example progress data.
+    
+    A fixed seed keeps the documentation plot stable between runs.
+    """
     start_date = datetime.now() - timedelta(days=30)
+    rng = np.random.default_rng(seed)
     
     # Generate word counts with realistic progression
-    dates = []
-    word_counts = []
-    commits = []
+    n_points = 20
+    dates = [start_date + timedelta(days=i * 1.5) for i in range(n_points)]
+    word_counts = generate_word_counts(rng, n_points=n_points)
     
-    base_count = 1000
-    for i in range(20):
-        date = start_date + timedelta(days=i * 1.5)
-        dates.append(date)
-        
-        # Add some variability
-        if i < 5:
-            words = base_count + i * 200 + np.random.randint(-50, 100)
-        elif i < 10:
-            words = word_counts[-1] + np.random.randint(100, 300)
-        elif i < 15:
-            words = word_counts[-1] + np.random.randint(150, 400)
-        else:
-            words = word_counts[-1] + np.random.randint(50, 200)
-        
-        word_counts.append(words)
-        
-        # Generate varied commit messages
-        messages = [
-            "Notes: Added introduction and background",
-            "Milestone: Completed literature review", 
-            "Progress: Wrote methodology section",
-            "Notes: Added experimental setup figures",
-            "Revisions: Addressed reviewer comments on theory",
-            "Fix: Corrected equations in section 3",
-            "Reference: Added recent citations",
-            "Progress: Finished results analysis",
-            "Milestone: Completed first draft",
-            "Notes: Added discussion section",
-            "Revisions: Updated abstract and conclusions",
-            "Fix: Corrected table formatting",
-            "Progress: Added appendix materials",
-            "Notes: Improved figure captions",
-            "Milestone: Submitted for review"
-        ]
-        
-        commits.append({
+    # Generate varied commit messages
+    commits = [
+        {
             'date': date.isoformat(),
-            'message': messages[i % len(messages)],
+            'message': EXAMPLE_MESSAGES[i % len(EXAMPLE_MESSAGES)],
             'hash': f"abc{i:04d}"
-        })
+        }
+        for i, date in enumerate(dates)
+    ]
     
     return dates, word_counts, commits
 
 
 def generate_example_bullets(commits):
     """Generate example bullet points for documentation."""
-    categories = {
-        "Notes": {"icon": "📝", "color": "#4CAF50"},
-        "Milestone": {"icon": "🎯", "color": "#FF9800"},
-        "Revisions": {"icon": "✏️", "color": "#F44336"},
-        "Progress": {"icon": "📈", "color": "#2196F3"},
-        "Fix": {"icon": "🔧", "color": "#9C27B0"},
-        "Reference": {"icon": "📚", "color": "#795548"},
-        "Other": {"icon": "•", "color": "#607D8B"}
-    }
-    
     bullets = ["### Recent Progress", ""]
     
     # Show last 8 commits
-    for commit in commits[-8:]:
-        category = commit['message'].split(':')[0]
-        message = commit['message'].split(':', 1)[1].strip()
-        
-        cat_info = categories.get(category, categories['Other'])
-        commit_date = datetime.fromisoformat(commit['date'])
-        date_str = commit_date.strftime('%m/%d/%Y')
+    recent_commits = commits[-8:]
+    date_strs = format_commit_dates([commit['date'] for commit in recent_commits])
+    parsed = parse_commit_categories([commit['message'] for commit in recent_commits])
+    
+    for (category, message), date_str in zip(parsed, date_strs):
+        cat_info = DEFAULT_CATEGORIES.get(category, DEFAULT_CATEGORIES['Other'])
         
         bullet = f"- {cat_info['icon']} **{category}**: {message} _{date_str}_"
         bullets.append(bullet)
@@ -95,58 +90,20 @@ def generate_example_bullets(commits):
 
 def create_example_plot():
     """Create a clean example progress plot."""
-    dates, word_counts, commits = generate_example_data()
-    
-    # Setup plot
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Plot word count line
-    ax.plot(dates, word_counts, 
-            color='#2E86AB', 
-            linewidth=2, 
-            marker='o', 
-            markersize=6,
-            label='Word Count')
-    
-    # Configure axes
-    ax.set_xlabel('Date', fontsize=12)
-    ax.set_ylabel('Word Count', fontsize=12)
-    ax.set_title('Manuscript Progress Tracking', fontsize=16, fontweight='bold')
-    
-    # Format x-axis dates
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-    ax.xaxis.set_major_locator(mdates.DayLocator(interval=3))
-    plt.xticks(rotation=45)
-    
-    # Add grid
-    ax.grid(True, alpha=0.3, linestyle='--')
-    
-    # Add statistics
-    total_change = word_counts[-1] - word_counts[0]
-    avg_per_commit = total_change / (len(word_counts) - 1)
+    _, word_counts, commits = generate_example_data()
     
-    stats_text = f"Total Words: {word_counts[-1]:,}\n"
-    stats_text += f"Total Change: {total_change:+,}\n"
-    stats_text += f"Avg per Commit: {avg_per_commit:+.0f}"
-    
-    ax.text(0.02, 0.98, stats_text, 
-            transform=ax.transAxes, 
-            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8),
-            verticalalignment='top',
-            fontsize=10)
-    
-    # Clean plot without annotations on the figure
-    
-    # Adjust layout and save
-    plt.tight_layout()
-    plt.savefig('../docs/example_plot.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    print("Example plot saved to docs/example_plot.png")
+    # Plot with the same code path the tracker uses
+    data = {
+        'word_counts': [
+            {'date': commit['date'], 'count': count}
+            for commit, count in zip(commits, word_counts)
+        ]
+    }
+    create_progress_plot(data, DEFAULT_CONFIG, '../docs/example_plot.png')
     
     # Generate and save example bullet points
     bullets = generate_example_bullets(commits)
-    with open('../docs/example_bullets.md', 'w') as f:
+    with open('../docs/example_bullets.md', 'w', encoding='utf-8') as f:
         f.write(f"""# Example Progress Section
 
 ![Progress Tracking](example_plot.png)
@@ -3,78 +3,214 @@
 Main script to track LaTeX manuscript progress using texcount.
 """
 
+import argparse
+import copy
+import functools
 import os
+import hashlib
 import json
 import subprocess
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import numpy as np
 import re
+import shlex
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Patterns for the total word count in texcount output, in order of preference
+TEXCOUNT_PATTERNS = (
+    re.compile(rb'Words in text:\s*(\d+)', re.IGNORECASE),
+    re.compile(rb'Total:\s*(\d+)', re.IGNORECASE),
+    re.compile(rb'(\d+)\s+words', re.IGNORECASE),
+    re.compile(rb'(\d+)\s+\+\s+\d+\s+\(.*?\)\s+=\s+(\d+)', re.IGNORECASE),
+    re.compile(rb'^(\d+)\+\d+\+\d+', re.MULTILINE),  # -brief style output
+)
+NUMBER_RE = re.compile(rb'\b(\d+)\b')
+
+# Size at which the append-only progress log is folded back into progress.json
+PROGRESS_LOG_MAX_BYTES = 32 * 1024
+
+# Files whose changes can affect the word count
+LATEX_SOURCE_SUFFIXES = ('.tex', '.bib')
+
+# Common main file names, in order of preference
+MAIN_TEX_NAMES = ['main.tex', 'manuscript.tex', 'paper.tex', 'article.tex', 'achemso-demo.tex']
+
+# Calendar date and time zone suffixes of ISO-8601 dates
+ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+UTC_SUFFIX_RE = re.compile(r'(?:Z|[+-]00:00)$')
+TZ_OFFSET_RE = re.compile(r'T.*[+-]\d{2}:?\d{2}$')
+
+# Matplotlib settings used while rendering the progress plot
+PLOT_RC_PARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+# Markers delimiting the generated section of the README
+PROGRESS_START_MARKER = "<!-- PROGRESS-TRACKER-START -->"
+PROGRESS_END_MARKER = "<!-- PROGRESS-TRACKER-END -->"
+PROGRESS_RE = re.compile(f"{re.escape(PROGRESS_START_MARKER)}.*?{re.escape(PROGRESS_END_MARKER)}", re.DOTALL)
+LAST_UPDATED_RE = re.compile(r'^\*Last updated: .*\*$', re.MULTILINE)
+
+# Commit messages containing these are the tracker's own updates
+AUTOMATED_COMMIT_MARKERS = ('[skip ci]', 'Update progress tracking')
+
+# "Category: message" commit message pattern
+CATEGORY_RE = re.compile(r'^(\w+):\s*(.+)')
+
+DEFAULT_CATEGORIES = {
+    "Notes": {"icon": "📝", "color": "#4CAF50"},
+    "Milestone": {"icon": "🎯", "color": "#FF9800"},
+    "Revisions": {"icon": "✏️", "color": "#F44336"},
+    "Progress": {"icon": "📈", "color": "#2196F3"},
+    "Fix": {"icon": "🔧", "color": "#9C27B0"},
+    "Reference": {"icon": "📚", "color": "#795548"},
+    "Other": {"icon": "•", "color": "#607D8B"}
+}
+
+DEFAULT_CONFIG = {
+    "plot_style": {
+        "figure_size": [10, 6],
+        "line_color": "#2E86AB",
+        "max_points": 500,
+        "categories": DEFAULT_CATEGORIES
+    },
+    "texcount_options": "-inc -chinese -japanese -korean -total"
+}
 
 
 def find_main_tex_file(repo_path):
     """Find the main .tex file in the repository."""
-    tex_files = list(Path(repo_path).glob("*.tex"))
+    with os.scandir(repo_path) as entries:
+        tex_files = {entry.name.lower(): Path(entry.path) for entry in entries
+                     if entry.name.endswith('.tex') and not entry.name.startswith('.')
+                     and entry.is_file()}
     
     if not tex_files:
         raise FileNotFoundError("No .tex files found in repository root")
     
     # Look for common main file patterns
-    for pattern in ['main.tex', 'manuscript.tex', 'paper.tex', 'article.tex', 'achemso-demo.tex']:
-        for tex_file in tex_files:
-            if tex_file.name.lower() == pattern:
-                return tex_file
+    for pattern in MAIN_TEX_NAMES:
+        if pattern in tex_files:
+            return tex_files[pattern]
     
-    # Look for \documentclass in files
-    for tex_file in tex_files:
+    # Look for \documentclass in files, stopping at the first hit
+    for tex_file in tex_files.values():
         try:
-            with open(tex_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(1000)  # Read first 1000 chars
-                if '\\documentclass' in content:
-                    return tex_file
-        except:
+            fd = os.open(tex_file, os.O_RDONLY)
+            try:
+                head = os.read(fd, 1024)
+            finally:
+                os.close(fd)
+            if b'\\documentclass' in head:
+                return tex_file
+        except OSError:
             continue
     
     # Default to first .tex file
-    return tex_files[0]
+    return next(iter(tex_files.values()))
+
+
+def texcount_cache_key(tex_file, options):
+    """Build a cache key from the main file, the options and the stat info of all .tex files.
+    
+    Returns None if any .tex file cannot be stat'ed (e.g. a dangling symlink).
+    """
+    tex_path = Path(tex_file).resolve()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{tex_path}\0{options}\0".encode())
+    
+    # Included files can live anywhere below the main file's directory,
+    # but not in hidden directories such as .git
+    for dirpath, dirnames, filenames in os.walk(tex_path.parent):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for name in sorted(filenames):
+            if not name.endswith('.tex'):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    
+    return h.hexdigest()
+
+
+def run_texcount(tex_file, options="-inc -total", cache_file=None):
+    """Run texcount on a LaTeX file and return the word count.
+    
+    Counts are memoized in-process and, if cache_file is given, on disk
+    while no .tex file changed. The disk cache is local-only: it is not
+    committed, and a fresh checkout resets mtimes, so CI always misses it.
+    """
+    key = texcount_cache_key(tex_file, options)
+    if key is None:
+        return _run_texcount(tex_file, options)
+    
+    if cache_file is not None:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('key') == key:
+                return cache['count']
+        except (OSError, ValueError):
+            pass
+    
+    word_count = _run_texcount_memo(str(tex_file), options, key)
+    
+    # 0 signals a texcount failure, so don't remember it
+    if not word_count:
+        _run_texcount_memo.cache_clear()
+    elif cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'count': word_count}, f)
+    
+    return word_count
 
 
-def run_texcount(tex_file, options="-inc -total"):
-    """Run texcount on a LaTeX file and return the word count."""
+@functools.lru_cache(maxsize=32)
+def _run_texcount_memo(tex_file, options, key):
+    """Run texcount once per process for each state of the .tex files (key)."""
+    return _run_texcount(tex_file, options)
+
+
+def _run_texcount(tex_file, options):
+    """Invoke texcount and parse the word count from its output."""
     try:
-        cmd = f"texcount {options} {tex_file}"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        cmd = ['texcount', *shlex.split(options), str(tex_file)]
+        result = subprocess.run(cmd, capture_output=True)
         
         if result.returncode != 0:
-            print(f"Warning: texcount returned non-zero exit code: {result.stderr}")
-        
-        # Parse texcount output
-        output = result.stdout
+            stderr = result.stderr.decode('utf-8', errors='replace')
+            print(f"Warning: texcount returned non-zero exit code: {stderr}")
         
-        # Look for the total word count with multiple patterns
-        patterns = [
-            r'Words in text:\s*(\d+)',
-            r'Total:\s*(\d+)',
-            r'(\d+)\s+words',
-            r'(\d+)\s+\+\s+\d+\s+\(.*?\)\s+=\s+(\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
+        # Look for the total word count directly in the raw output
+        for pattern in TEXCOUNT_PATTERNS:
+            match = pattern.search(result.stdout)
             if match:
-                return int(match.group(1) if len(match.groups()) == 1 else match.group(2))
+                return int(match.group(match.lastindex))
+        
+        # A successful run with no recognizable total won't do better with -brief
+        if result.returncode == 0:
+            return 0
         
-        # If no patterns match, try simpler texcount
-        simple_cmd = f"texcount -brief {tex_file}"
-        simple_result = subprocess.run(simple_cmd, shell=True, capture_output=True, text=True)
+        # If the full run failed, try simpler texcount
+        simple_cmd = ['texcount', '-brief', str(tex_file)]
+        simple_result = subprocess.run(simple_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         
         # Look for any numbers in the simple output
-        numbers = re.findall(r'\b(\d+)\b', simple_result.stdout)
-        if numbers:
-            return int(numbers[0])
+        match = NUMBER_RE.search(simple_result.stdout)
+        if match:
+            return int(match.group(1))
         
         return 0  # Return 0 instead of crashing
         
@@ -86,29 +222,16 @@ def run_texcount(tex_file, options="-inc -total"):
 def get_commit_info():
     """Get information about the current commit."""
     try:
-        # Get commit hash
-        commit_hash = subprocess.check_output(
-            ['git', 'rev-parse', 'HEAD'], text=True
-        ).strip()
-        
-        # Get commit message
-        commit_message = subprocess.check_output(
-            ['git', 'log', '-1', '--pretty=%B'], text=True
-        ).strip()
-        
-        # Get commit date
-        commit_date = subprocess.check_output(
-            ['git', 'log', '-1', '--pretty=%cI'], text=True
-        ).strip()
-        
-        # Get author
-        commit_author = subprocess.check_output(
-            ['git', 'log', '-1', '--pretty=%an'], text=True
-        ).strip()
+        # Fetch hash, date, author and message in a single git call
+        result = subprocess.run(
+            ['git', 'log', '-1', '--pretty=format:%H%x1f%cI%x1f%an%x1f%B'],
+            stdout=subprocess.PIPE, text=True, check=True
+        )
+        commit_hash, commit_date, commit_author, commit_message = result.stdout.split('\x1f', 3)
         
         return {
             'hash': commit_hash[:7],
-            'message': commit_message,
+            'message': commit_message.strip(),
             'date': commit_date,
             'author': commit_author
         }
@@ -117,118 +240,277 @@ def get_commit_info():
         return None
 
 
+def latex_changed_since(commit_hash):
+    """Check whether any LaTeX source differs between a commit and the working tree."""
+    try:
+        result = subprocess.run(
+            ['git', 'diff', '--name-only', commit_hash, '--'],
+            stdout=subprocess.PIPE, text=True, check=True
+        )
+    except Exception as e:
+        # Unknown commit (e.g. rewritten history), so assume everything changed
+        print(f"Warning: could not diff against {commit_hash}: {e}")
+        return True
+    
+    return any(path.endswith(LATEX_SOURCE_SUFFIXES) for path in result.stdout.splitlines())
+
+
 def parse_commit_category(message):
     """Parse commit message for category."""
-    # Look for "Category: message" pattern
-    match = re.match(r'^(\w+):\s*(.+)', message)
+    match = CATEGORY_RE.match(message)
     if match:
         return match.group(1), match.group(2)
     return "Other", message
 
 
+def parse_commit_categories(messages):
+    """Parse categories for a batch of commit messages."""
+    matches = map(CATEGORY_RE.match, messages)
+    return [match.groups() if match else ("Other", message)
+            for match, message in zip(matches, messages)]
+
+
 def load_progress_data(progress_file):
-    """Load existing progress data."""
+    """Load existing progress data, including entries from the append-only log."""
     if progress_file.exists():
-        with open(progress_file, 'r') as f:
-            return json.load(f)
-    return {
-        "word_counts": [],
-        "commits": [],
-        "metadata": {}
-    }
+        if orjson is not None:
+            data = orjson.loads(progress_file.read_bytes())
+        else:
+            with open(progress_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+    else:
+        data = {
+            "word_counts": [],
+            "commits": [],
+            "metadata": {}
+        }
+    
+    # Replay runs recorded since the last compaction
+    log_file = progress_file.with_suffix('.jsonl')
+    if log_file.exists():
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(log_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    for key, entry in loads(line).items():
+                        data.setdefault(key, []).append(entry)
+    
+    return data
 
 
 def save_progress_data(progress_file, data):
     """Save progress data."""
     progress_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(progress_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Serialize in memory first so the file is written in a single call
+    if orjson is not None:
+        progress_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        progress_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
 
 
-def load_config(repo_path):
-    """Load configuration."""
+def is_tracked_by_git(path):
+    """Check whether a file is tracked in the git repository containing it."""
+    try:
+        result = subprocess.run(
+            ['git', 'ls-files', '--', path.name],
+            cwd=path.parent, stdout=subprocess.PIPE, text=True, check=True
+        )
+    except Exception as e:
+        print(f"Warning: could not check whether {path} is tracked: {e}")
+        return False
+    
+    return bool(result.stdout.strip())
+
+
+def append_progress_entry(progress_file, data, record):
+    """Record one run's new entries without rewriting the whole history.
+    
+    record maps list names in data (e.g. 'commits') to the entry appended
+    to them this run; data must already include it. Once the log grows past
+    PROGRESS_LOG_MAX_BYTES it is compacted into progress_file. The log is
+    also compacted while git does not track it, since a workflow that only
+    commits progress.json would otherwise throw every appended run away.
+    """
+    log_file = progress_file.with_suffix('.jsonl')
+    if (not is_tracked_by_git(log_file)
+            or log_file.stat().st_size >= PROGRESS_LOG_MAX_BYTES):
+        save_progress_data(progress_file, data)
+        # Truncate rather than delete so the workflow's git add keeps matching
+        log_file.write_bytes(b'')
+        return
+    
+    if orjson is not None:
+        line = orjson.dumps(record) + b'\n'
+    else:
+        line = (json.dumps(record) + '\n').encode('utf-8')
+    
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, 'ab') as f:
+        f.write(line)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_file(repo_path):
+    """Parse the config file, or return None if there is none."""
     config_file = Path(repo_path) / '.progress-tracker.config'
     if config_file.exists():
-        with open(config_file, 'r') as f:
+        with open(config_file, 'r', encoding='utf-8') as f:
             return json.load(f)
     
-    # Default configuration
-    return {
-        "plot_style": {
-            "figure_size": [10, 6],
-            "line_color": "#2E86AB",
-            "categories": {
-                "Notes": {"icon": "📝", "color": "#4CAF50"},
-                "Milestone": {"icon": "🎯", "color": "#FF9800"},
-                "Revisions": {"icon": "✏️", "color": "#F44336"},
-                "Progress": {"icon": "📈", "color": "#2196F3"},
-                "Fix": {"icon": "🔧", "color": "#9C27B0"},
-                "Reference": {"icon": "📚", "color": "#795548"},
-                "Other": {"icon": "•", "color": "#607D8B"}
-            }
-        },
-        "texcount_options": "-inc -chinese -japanese -korean -total"
-    }
+    return None
+
+
+def load_config(repo_path):
+    """Load configuration."""
+    # Hand out a copy so callers can't mutate the cached or default config
+    config = _load_config_file(repo_path)
+    return copy.deepcopy(config if config is not None else DEFAULT_CONFIG)
+
+
+def _lttb(x, y, n_out):
+    """Downsample a series with Largest-Triangle-Three-Buckets."""
+    import numpy as np
+    
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    # First and last points are always kept; the rest are split into buckets
+    buckets = np.array_split(np.arange(1, n - 1), n_out - 2)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    
+    a = 0
+    for i, bucket in enumerate(buckets):
+        # Average of the next bucket is the third triangle vertex
+        nxt = buckets[i + 1] if i + 1 < len(buckets) else np.array([n - 1])
+        cx, cy = x[nxt].mean(), y[nxt].mean()
+        
+        bx, by = x[bucket], y[bucket]
+        areas = np.abs((x[a] - cx) * (by - y[a]) - (x[a] - bx) * (cy - y[a]))
+        a = bucket[np.argmax(areas)]
+        keep[i + 1] = a
+    
+    return x[keep], y[keep]
 
 
-def create_progress_plot(data, config, output_file):
-    """Create a clean progress plot showing word count over time."""
+def parse_dates(date_strs):
+    """Parse ISO-8601 date strings into a naive UTC datetime64 array."""
+    import numpy as np
+    
+    # numpy parses naive timestamps natively, so only UTC markers need stripping
+    stripped = [UTC_SUFFIX_RE.sub('', d) for d in date_strs]
+    if not any(map(TZ_OFFSET_RE.search, stripped)):
+        return np.array(stripped, dtype='datetime64[us]')
+    
+    # Other UTC offsets need a full datetime parse
+    dates = [datetime.fromisoformat(d.replace('Z', '+00:00')) for d in date_strs]
+    return np.array([d.astimezone(timezone.utc).replace(tzinfo=None) if d.tzinfo else d
+                     for d in dates], dtype='datetime64[us]')
+
+
+def format_commit_dates(date_strs):
+    """Format ISO-8601 date strings as MM/DD/YYYY in their own time zone."""
+    # The calendar date is already spelled out at the start of an ISO string
+    return [f"{match.group(2)}/{match.group(3)}/{match.group(1)}" if match else
+            datetime.fromisoformat(d.replace('Z', '+00:00')).strftime('%m/%d/%Y')
+            for d, match in zip(date_strs, map(ISO_DATE_RE.match, date_strs))]
+
+
+def plot_input_hash(data, config, dpi):
+    """Hash everything that affects the rendered progress plot."""
+    payload = json.dumps([data['word_counts'], config['plot_style'], dpi], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def create_progress_plot(data, config, output_file, dpi=150, hash_file=None):
+    """Create a clean progress plot showing word count over time.
+    
+    If hash_file is given, rendering is skipped while the plot inputs are
+    unchanged and the previous output file still exists.
+    """
     if not data['word_counts']:
         print("No data to plot yet")
         return
     
-    # Extract data
-    dates = [datetime.fromisoformat(item['date'].replace('Z', '+00:00')) 
-             for item in data['word_counts']]
-    word_counts = [item['count'] for item in data['word_counts']]
+    if hash_file is not None:
+        plot_hash = plot_input_hash(data, config, dpi)
+        if Path(output_file).exists() and hash_file.exists() and hash_file.read_text(encoding='utf-8') == plot_hash:
+            print(f"Progress plot unchanged, keeping {output_file}")
+            return
+    
+    # Plotting libraries are slow to import, so load them only when needed
+    import matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    import matplotlib.dates as mdates
+    import numpy as np
+    
+    # Extract data as arrays
+    dates = parse_dates([item['date'] for item in data['word_counts']])
+    word_counts = np.fromiter((item['count'] for item in data['word_counts']),
+                              dtype=np.int64, count=len(data['word_counts']))
     
-    # Setup plot
     plot_config = config['plot_style']
-    fig, ax = plt.subplots(figsize=plot_config['figure_size'])
-    
-    # Plot word count line
-    ax.plot(dates, word_counts, 
-            color=plot_config['line_color'], 
-            linewidth=2, 
-            marker='o', 
-            markersize=6,
-            label='Word Count')
-    
-    # Configure axes
-    ax.set_xlabel('Date', fontsize=12)
-    ax.set_ylabel('Word Count', fontsize=12)
-    ax.set_title('Manuscript Progress Tracking', fontsize=16, fontweight='bold')
-    
-    # Format x-axis dates
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-    ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates) // 10)))
-    plt.xticks(rotation=45)
-    
-    # Add grid
-    ax.grid(True, alpha=0.3, linestyle='--')
-    
-    # Calculate statistics
-    if len(word_counts) > 1:
-        total_change = word_counts[-1] - word_counts[0]
-        avg_per_commit = total_change / (len(word_counts) - 1) if len(word_counts) > 1 else 0
+    
+    # Simplify long paths before they reach the Agg rasterizer
+    with matplotlib.rc_context(PLOT_RC_PARAMS):
+        # Setup plot
+        fig = Figure(figsize=plot_config['figure_size'], layout='constrained')
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
         
-        # Add statistics text
-        stats_text = f"Total Words: {word_counts[-1]:,}\n"
-        stats_text += f"Total Change: {total_change:+,}\n"
-        stats_text += f"Avg per Commit: {avg_per_commit:+.0f}"
+        # Downsample long histories; statistics below still use the raw data
+        plot_dates, plot_counts = dates, word_counts
+        max_points = plot_config.get('max_points', DEFAULT_CONFIG['plot_style']['max_points'])
+        if len(word_counts) > max_points:
+            plot_dates, plot_counts = _lttb(mdates.date2num(dates), word_counts, n_out=max_points)
         
-        ax.text(0.02, 0.98, stats_text, 
-                transform=ax.transAxes, 
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8),
-                verticalalignment='top',
-                fontsize=10)
-    
-    # Clean plot without annotations on the figure
+        # Plot word count line
+        ax.plot(plot_dates, plot_counts, 
+                color=plot_config['line_color'], 
+                linewidth=2, 
+                marker='o', 
+                markersize=6,
+                label='Word Count')
+        
+        # Configure axes
+        ax.set_xlabel('Date', fontsize=12)
+        ax.set_ylabel('Word Count', fontsize=12)
+        ax.set_title('Manuscript Progress Tracking', fontsize=16, fontweight='bold')
+        
+        # Format x-axis dates
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+        ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates) // 10)))
+        ax.tick_params(axis='x', labelrotation=45)
+        
+        # Add grid
+        ax.grid(True, alpha=0.3, linestyle='--')
+        
+        # Calculate statistics
+        if len(word_counts) > 1:
+            total_change = word_counts[-1] - word_counts[0]
+            avg_per_commit = total_change / (len(word_counts) - 1) if len(word_counts) > 1 else 0
+            
+            # Add statistics text
+            stats_text = f"Total Words: {word_counts[-1]:,}\n"
+            stats_text += f"Total Change: {total_change:+,}\n"
+            stats_text += f"Avg per Commit: {avg_per_commit:+.0f}"
+            
+            ax.text(0.02, 0.98, stats_text, 
+                    transform=ax.transAxes, 
+                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.8),
+                    verticalalignment='top',
+                    fontsize=10)
+        
+        # Clean plot without annotations on the figure
+        
+        # Constrained layout already fits the labels, so no tight bbox pass is needed
+        fig.savefig(output_file, dpi=dpi)
     
-    # Adjust layout and save
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    if hash_file is not None:
+        hash_file.parent.mkdir(parents=True, exist_ok=True)
+        hash_file.write_text(plot_hash, encoding='utf-8')
     
     print(f"Progress plot saved to {output_file}")
 
@@ -239,13 +521,16 @@ def generate_commit_bullets(data, config, max_commits=10):
         return ""
     
     categories = config['plot_style']['categories']
+    default_cat = categories['Other']
     bullets = []
     
-    # Get recent commits (excluding automated ones)
+    # Get the last max_commits non-automated commits, newest first
     recent_commits = []
-    for commit in reversed(data['commits'][-max_commits:]):
-        if '[skip ci]' not in commit['message'] and 'Update progress tracking' not in commit['message']:
+    for commit in reversed(data['commits']):
+        if not any(marker in commit['message'] for marker in AUTOMATED_COMMIT_MARKERS):
             recent_commits.append(commit)
+            if len(recent_commits) == max_commits:
+                break
     
     if not recent_commits:
         return ""
@@ -253,13 +538,12 @@ def generate_commit_bullets(data, config, max_commits=10):
     bullets.append("### Recent Progress")
     bullets.append("")
     
-    for commit in recent_commits[-10:]:  # Show last 10 non-automated commits
-        category, message = parse_commit_category(commit['message'])
-        cat_info = categories.get(category, categories['Other'])
-        
-        # Format commit date
-        commit_date = datetime.fromisoformat(commit['date'].replace('Z', '+00:00'))
-        date_str = commit_date.strftime('%m/%d/%Y')
+    # Format commit dates and parse categories in one pass each
+    date_strs = format_commit_dates([commit['date'] for commit in recent_commits])
+    parsed = parse_commit_categories([commit['message'] for commit in recent_commits])
+    
+    for (category, message), date_str in zip(parsed, date_strs):
+        cat_info = categories.get(category, default_cat)
         
         # Create bullet point
         bullet = f"- {cat_info['icon']} **{category}**: {message} _{date_str}_"
@@ -274,20 +558,15 @@ def update_readme(repo_path, plot_file, data, config):
     
     # Read existing README
     if readme_path.exists():
-        with open(readme_path, 'r') as f:
-            content = f.read()
+        content = readme_path.read_text(encoding='utf-8')
     else:
         content = ""
     
-    # Marker for progress section
-    start_marker = "<!-- PROGRESS-TRACKER-START -->"
-    end_marker = "<!-- PROGRESS-TRACKER-END -->"
-    
     # Generate bullet points for recent commits
     bullet_points = generate_commit_bullets(data, config)
     
     progress_section = f"""
-{start_marker}
+{PROGRESS_START_MARKER}
 ## 📊 Manuscript Progress
 
 ![Progress Tracking]({plot_file.name})
@@ -295,14 +574,20 @@ def update_readme(repo_path, plot_file, data, config):
 {bullet_points}
 
 *Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC*
-{end_marker}
+{PROGRESS_END_MARKER}
 """
     
     # Update or add progress section
-    if start_marker in content:
-        # Replace existing section
-        pattern = f"{start_marker}.*?{end_marker}"
-        content = re.sub(pattern, progress_section.strip(), content, flags=re.DOTALL)
+    existing = PROGRESS_RE.search(content)
+    if existing:
+        # Leave the file alone if nothing but the timestamp would change
+        new_section = progress_section.strip()
+        if LAST_UPDATED_RE.sub('', existing.group(0)) == LAST_UPDATED_RE.sub('', new_section):
+            print("README.md already up to date")
+            return
+        
+        # Replace existing section; a function keeps backslashes in commit messages literal
+        content = PROGRESS_RE.sub(lambda match: new_section, content, count=1)
     else:
         # Add to beginning of README
         if content:
@@ -311,14 +596,18 @@ def update_readme(repo_path, plot_file, data, config):
             content = f"# Manuscript\n\n{progress_section}"
     
     # Write updated README
-    with open(readme_path, 'w') as f:
-        f.write(content)
+    readme_path.write_text(content, encoding='utf-8')
     
     print(f"README.md updated")
 
 
 def main():
     """Main tracking function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--dpi', type=int, default=150,
+                        help='Resolution of the saved progress plot (default: 150)')
+    args = parser.parse_args()
+    
     # Get repository root
     repo_path = Path.cwd()
     
@@ -333,19 +622,37 @@ def main():
     
     print(f"Using LaTeX file: {tex_file}")
     
-    # Run texcount
-    word_count = run_texcount(tex_file, config.get('texcount_options', '-inc -total'))
+    # Load existing data
+    progress_file = repo_path / '.progress-data' / 'progress.json'
+    data = load_progress_data(progress_file)
+    
+    # Settings the count depends on, recorded with each commit
+    count_settings = {
+        'tex_file': os.path.relpath(tex_file, repo_path),
+        'texcount_options': config.get('texcount_options', '-inc -total')
+    }
+    
+    # Run texcount, unless the last count is still valid: it succeeded, used the
+    # same settings, and no LaTeX source changed since the last tracked commit
+    last_commit = data['commits'][-1] if data['commits'] else None
+    if (data['word_counts'] and data['word_counts'][-1]['count'] != 0
+            and last_commit is not None
+            and all(last_commit.get(key) == value for key, value in count_settings.items())
+            and not latex_changed_since(last_commit['hash'])):
+        word_count = data['word_counts'][-1]['count']
+        print(f"No LaTeX changes since {last_commit['hash']}, reusing word count")
+    else:
+        cache_file = repo_path / '.progress-data' / 'texcount_cache.json'
+        word_count = run_texcount(tex_file, count_settings['texcount_options'], cache_file)
     print(f"Current word count: {word_count}")
     
     # Get commit info
     commit_info = get_commit_info()
     
-    # Load existing data
-    progress_file = repo_path / '.progress-data' / 'progress.json'
-    data = load_progress_data(progress_file)
-    
     # Add new data point
     if commit_info:
+        commit_info.update(count_settings)
+        
         new_entry = {
             'date': commit_info['date'],
             'count': word_count,
@@ -353,19 +660,24 @@ def main():
             'author': commit_info['author']
         }
         
+        record = {}
+        
         # Only add if different from last entry
         if not data['word_counts'] or data['word_counts'][-1]['count'] != word_count:
             data['word_counts'].append(new_entry)
+            record['word_counts'] = new_entry
         
         # Add commit info
         data['commits'].append(commit_info)
-    
-    # Save updated data
-    save_progress_data(progress_file, data)
+        record['commits'] = commit_info
+        
+        # Save updated data
+        append_progress_entry(progress_file, data, record)
     
     # Create plot
     plot_file = repo_path / 'progress_plot.png'
-    create_progress_plot(data, config, plot_file)
+    hash_file = repo_path / '.progress-data' / 'plot.hash'
+    create_progress_plot(data, config, plot_file, dpi=args.dpi, hash_file=hash_file)
     
     # Update README
     update_readme(repo_path, plot_file, data, config)
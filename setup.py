@@ -66,7 +66,7 @@ def setup(repo_path):
                 "tracker_version": "1.0.0"
             }
         }
-        with open(progress_file, 'w') as f:
+        with open(progress_file, 'w', encoding='utf-8') as f:
             json.dump(initial_data, f, indent=2)
         click.echo(f"SUCCESS: Initialized progress data file at {progress_file}")
     
@@ -74,10 +74,8 @@ def setup(repo_path):
     scripts_src = Path(__file__).parent / 'scripts'
     scripts_dest = repo_path / '.github' / 'scripts'
     
-    if scripts_dest.exists():
-        shutil.rmtree(scripts_dest)
-    
-    shutil.copytree(scripts_src, scripts_dest)
+    # Overwrite in place rather than deleting and recreating every file
+    shutil.copytree(scripts_src, scripts_dest, dirs_exist_ok=True)
     click.echo(f"SUCCESS: Copied tracking scripts to {scripts_dest}")
     
     # Create configuration file
@@ -87,6 +85,7 @@ def setup(repo_path):
         "plot_style": {
             "figure_size": [10, 6],
             "line_color": "#2E86AB",
+            "max_points": 500,
             "categories": {
                 "Notes": {"icon": "📝", "color": "#4CAF50"},
                 "Milestone": {"icon": "🎯", "color": "#FF9800"},
@@ -100,7 +99,7 @@ def setup(repo_path):
         "texcount_options": "-inc -chinese -japanese -korean -total"
     }
     
-    with open(config_file, 'w') as f:
+    with open(config_file, 'w', encoding='utf-8') as f:
         json.dump(config_data, f, indent=2)
     click.echo(f"SUCCESS: Created configuration file at {config_file}")
     
@@ -108,21 +107,20 @@ def setup(repo_path):
     gitignore_path = repo_path / '.gitignore'
     gitignore_additions = [
         "\n# Progress Tracker",
-        ".progress-tracker.config"
+        ".progress-tracker.config",
+        ".progress-data/texcount_cache.json"
     ]
     
     if gitignore_path.exists():
-        with open(gitignore_path, 'r') as f:
-            content = f.read()
-        
-        for line in gitignore_additions:
-            if line.strip() and line not in content:
-                content += f"\n{line}"
-        
-        with open(gitignore_path, 'w') as f:
-            f.write(content)
+        with open(gitignore_path, 'r+', encoding='utf-8') as f:
+            existing = set(f.read().splitlines())
+            
+            # Append only the lines that are missing; the read left us at the end
+            missing = [line for line in gitignore_additions if line.strip() not in existing]
+            if missing:
+                f.write(''.join(f"\n{line}" for line in missing))
     else:
-        with open(gitignore_path, 'w') as f:
+        with open(gitignore_path, 'w', encoding='utf-8') as f:
             f.write('\n'.join(gitignore_additions))
     
     click.echo(f"SUCCESS: Updated .gitignore")